@@ -32,6 +32,29 @@ class DataDefinition:
         """
         raise NotImplementedError(f"{type(self)} has not implemented dump() method")
 
+    def dump_to(self, outfile: typing.TextIO) -> None:
+        """
+        Writes the human-readable output to a text file object.
+
+        Definitions with large outputs can override this to write
+        their content piece by piece instead of creating the whole
+        string from dump() first.
+
+        :param outfile: File object the output is written to.
+        :type outfile: typing.TextIO
+        """
+        outfile.write(self.dump())
+
+    def dump_extra_files(self) -> dict[str, bytes]:
+        """
+        Creates the content of additional files that are exported next to
+        the human-readable file, e.g. binary data referenced by it.
+
+        :returns: File contents by filename, relative to the target directory.
+        :rtype: dict
+        """
+        return {}
+
     def set_filename(self, filename: str) -> None:
         """
         Sets the filename for the file.
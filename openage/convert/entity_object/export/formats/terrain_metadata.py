@@ -6,15 +6,26 @@
 Terrain definition file.
 """
 from __future__ import annotations
+import io
 import typing
 
 
 from enum import Enum
 
+import numpy
+
 from ..data_definition import DataDefinition
 
 FORMAT_VERSION = '1'
 
+# frame_idx layer_id img_id xpos ypos xsize ysize priority blend_mode
+FRAME_LINE_FORMAT = "frame %d %d %d %d %d %d %d %d %d\n"
+
+# dtype of the frame values in the binary frames file
+FRAME_BINARY_DTYPE = numpy.dtype('<i4')
+
+FILE_HEADER = f"# openage terrain definition file\n\nversion {FORMAT_VERSION}\n\n"
+
 
 class LayerMode(Enum):
     """
@@ -34,10 +45,13 @@ class TerrainMetadata(DataDefinition):
         super().__init__(targetdir, filename)
 
         self.scalefactor = 1.0
-        self.image_files: dict[int, dict[str, typing.Any]] = {}
-        self.blendtable: dict[str, typing.Any] = None
-        self.layers: dict[int, dict[str, typing.Any]] = {}
-        self.frames: list[dict[str, int]] = []
+        self.image_files: dict[int, str] = {}
+        self.blendtable: tuple[int, str] = None
+        self.layers: dict[int, str] = {}
+        self.frames: list[tuple[int, int, int, int, int, int, int, int, int]] = []
+
+        # if set, frames are stored in this binary file instead of the .terrain file
+        self.frames_filename: str = None
 
     def add_image(self, img_id: int, filename: str) -> None:
         """
@@ -48,10 +62,7 @@ class TerrainMetadata(DataDefinition):
         :param filename: Path to the image file.
         :type filename: str
         """
-        self.image_files[img_id] = {
-            "image_id": img_id,
-            "filename": filename,
-        }
+        self.image_files[img_id] = filename
 
     def add_layer(
         self,
@@ -75,13 +86,13 @@ class TerrainMetadata(DataDefinition):
         :param replay_delay: Time delay before replaying the animation.
         :type replay_delay: float
         """
-        self.layers[layer_id] = {
-            "layer_id": layer_id,
-            "mode": mode,
-            "position": position,
-            "time_per_frame": time_per_frame,
-            "replay_delay": replay_delay,
-        }
+        self.layers[layer_id] = (
+            f"layer {layer_id}"
+            f"{f' mode={mode.value}' if mode else ''}"
+            f"{f' position={position}' if position else ''}"
+            f"{f' time_per_frame={time_per_frame}' if time_per_frame else ''}"
+            f"{f' replay_delay={replay_delay}' if replay_delay else ''}\n"
+        )
 
     def add_frame(
         self,
@@ -117,19 +128,17 @@ class TerrainMetadata(DataDefinition):
         :param blend_mode: Used for looking up the blending pattern index in the blending table.
         :type blend_mode: int
         """
-        self.frames.append(
-            {
-                "frame_idx": frame_idx,
-                "layer_id": layer_id,
-                "img_id": img_id,
-                "xpos": xpos,
-                "ypos": ypos,
-                "xsize": xsize,
-                "ysize": ysize,
-                "priority": priority,
-                "blend_mode": blend_mode,
-            }
-        )
+        self.frames.append((
+            frame_idx,
+            layer_id,
+            img_id,
+            xpos,
+            ypos,
+            xsize,
+            ysize,
+            priority,
+            blend_mode,
+        ))
 
     def set_blendtable(self, table_id: int, filename: str) -> None:
         """
@@ -140,10 +149,7 @@ class TerrainMetadata(DataDefinition):
         :param filename: Path to the blendtable file.
         :type filename: str
         """
-        self.blendtable = {
-            "table_id": table_id,
-            "filename": filename,
-        }
+        self.blendtable = (table_id, filename)
 
     def set_scalefactor(self, factor: typing.Union[int, float]) -> None:
         """
@@ -154,52 +160,125 @@ class TerrainMetadata(DataDefinition):
         """
         self.scalefactor = float(factor)
 
+    def set_frames_file(self, filename: str) -> None:
+        """
+        Store the frame definitions in a separate binary file. The .terrain
+        file then only references this file.
+
+        Each frame is written as 9 little endian int32 values in the
+        order of the frame line fields.
+
+        The binary file content is returned by dump_extra_files(), so
+        it is written next to the .terrain file on export.
+
+        :param filename: Path to the binary frames file.
+        :type filename: str
+        """
+        self.frames_filename = filename
+
+    def dump_frames_to(self, outfile: typing.BinaryIO) -> None:
+        """
+        Write the binary frame definitions to a file object.
+
+        :param outfile: File object the frames are written to.
+        :type outfile: typing.BinaryIO
+        """
+        frames = numpy.array(self.frames, dtype=FRAME_BINARY_DTYPE).reshape(-1, 9)
+        outfile.write(frames.data)
+
+    def dump_extra_files(self) -> dict[str, bytes]:
+        if self.frames_filename is None:
+            return {}
+
+        output = io.BytesIO()
+        self.dump_frames_to(output)
+
+        return {self.frames_filename: output.getvalue()}
+
     def dump(self) -> str:
-        output_str = ""
+        output = io.StringIO()
+        self.dump_to(output)
 
-        # header
-        output_str += "# openage terrain definition file\n\n"
+        return output.getvalue()
 
-        # version
-        output_str += f"version {FORMAT_VERSION}\n\n"
+    def dump_to(self, outfile: typing.TextIO) -> None:
+        if self.blendtable is None:
+            # fail before any output is written
+            raise ValueError(f"{self} has no blendtable set")
+
+        # header and version
+        outfile.write(FILE_HEADER)
 
         # image files
-        for image in self.image_files.values():
-            output_str += f"imagefile {image['image_id']} {image['filename']}\n"
+        for img_id, filename in self.image_files.items():
+            outfile.write(f"imagefile {img_id} {filename}\n")
 
-        output_str += "\n"
+        outfile.write("\n")
 
         # blendtable reference
-        output_str += f"blendtable {self.blendtable['table_id']} {self.blendtable['filename']}\n\n"
+        outfile.write(f"blendtable {self.blendtable[0]} {self.blendtable[1]}\n\n")
 
         # scale factor
-        output_str += f"scalefactor {self.scalefactor}\n\n"
+        outfile.write(f"scalefactor {self.scalefactor}\n\n")
 
         # layer definitions
-        for layer in self.layers.values():
-            output_str += f"layer {layer['layer_id']}"
+        outfile.writelines(self.layers.values())
+        outfile.write("\n")
+
+        # frame definitions
+        if self.frames_filename:
+            outfile.write(f"frames_bin {self.frames_filename} {len(self.frames)}\n")
+
+        else:
+            outfile.writelines(map(FRAME_LINE_FORMAT.__mod__, self.frames))
+
+    def __repr__(self):
+        return f'TerrainMetadata<{self.filename}>'
 
-            if layer["mode"]:
-                output_str += f" mode={layer['mode'].value}"
 
-            if layer["position"]:
-                output_str += f" position={layer['position']}"
+def test_frames_file() -> None:
+    """
+    Tests storing terrain frames in a binary frames file.
+    """
+    from tempfile import TemporaryDirectory
 
-            if layer["time_per_frame"]:
-                output_str += f" time_per_frame={layer['time_per_frame']}"
+    from .....testing.testing import assert_value
+    from .....util.fslike.directory import Directory
+    from ....processor.export.data_exporter import DataExporter
 
-            if layer["replay_delay"]:
-                output_str += f" replay_delay={layer['replay_delay']}"
+    terrain = TerrainMetadata("terrain", "test.terrain")
+    terrain.set_blendtable(0, "test.bltable")
+    terrain.add_image(0, "test.png")
+    terrain.add_layer(0)
+    terrain.add_frame(0, 0, 0, 0, 0, 100, 50, 1, 2)
+    terrain.add_frame(1, 0, 0, 100, 0, 100, 50, -1, 2)
 
-            output_str += "\n"
+    # text mode
+    assert_value(terrain.dump_extra_files(), {})
+    assert_value(terrain.dump().splitlines()[-1], "frame 1 0 0 100 0 100 50 -1 2")
 
-        output_str += "\n"
+    # binary mode
+    terrain.set_frames_file("test.frames")
+    output_lines = terrain.dump().splitlines()
+    assert_value(output_lines[-1], "frames_bin test.frames 2")
+    assert_value([line for line in output_lines if line.startswith("frame ")], [])
 
-        # frame definitions
-        for frame in self.frames:
-            output_str += f'frame {" ".join(str(param) for param in frame.values())}\n'
+    output = io.BytesIO()
+    terrain.dump_frames_to(output)
+    frames = numpy.frombuffer(output.getvalue(), dtype='<i4').reshape(-1, 9)
+    assert_value([tuple(frame) for frame in frames.tolist()], terrain.frames)
 
-        return output_str
+    assert_value(terrain.dump_extra_files(), {"test.frames": output.getvalue()})
 
-    def __repr__(self):
-        return f'TerrainMetadata<{self.filename}>'
+    # export writes the frames file next to the .terrain file
+    with TemporaryDirectory() as tempdir:
+        root = Directory(tempdir).root
+        root["terrain"].mkdirs()
+
+        DataExporter.export([terrain], root)
+
+        with root["terrain"]["test.terrain"].open("rb") as infile:
+            assert_value(infile.read(), terrain.dump().encode('utf-8'))
+
+        with root["terrain"]["test.frames"].open("rb") as infile:
+            assert_value(infile.read(), output.getvalue())
@@ -29,24 +29,52 @@ class TextureImage:
     represents a image created from a (r,g,b,a) matrix.
     """
 
+    __slots__ = ('width', 'height', 'hotspot', '_data', '_source', '_pil_cache')
+
     def __init__(
         self,
-        picture_data: typing.Union[Image.Image, numpy.ndarray],
-        hotspot: tuple[int, int] = None
+        picture_data: typing.Union[Image.Image, numpy.ndarray,
+                                   typing.Callable[[], typing.Union[Image.Image, numpy.ndarray]]],
+        hotspot: tuple[int, int] = None,
+        size: tuple[int, int] = None
     ):
+        """
+        Create a texture image.
+
+        The pixels of PIL images and loader functions are only converted
+        when the image data is accessed for the first time. Errors in the
+        data they provide are therefore only raised on that access.
+
+        :param picture_data: Image, pixel array or function returning one of them.
+        :type picture_data: PIL.Image.Image, numpy.ndarray, Callable
+        :param hotspot: Hotspot of the image.
+        :type hotspot: tuple
+        :param size: (width, height) of the image. Required if picture_data is a function.
+        :type size: tuple
+        """
+        # pixel data, converted from the source on first access if not passed directly
+        self._data: numpy.ndarray = None
+        self._source: typing.Union[
+            Image.Image,
+            typing.Callable[[], typing.Union[Image.Image, numpy.ndarray]]
+        ] = None
 
         if isinstance(picture_data, Image.Image):
-            if picture_data.mode != 'RGBA':
-                picture_data = picture_data.convert('RGBA')
+            # PIL knows the size without decoding the pixels
+            self.width, self.height = picture_data.size
+            self._source = picture_data
 
-            picture_data = numpy.array(picture_data)
+        elif callable(picture_data):
+            if size is None:
+                raise ValueError("Texture image created from a loader function "
+                                 "requires the image size")
 
-        if not isinstance(picture_data, numpy.ndarray):
-            raise ValueError("Texture image must be created from PIL Image "
-                             "or numpy array, not '%s'" % type(picture_data))
+            self.width, self.height = size
+            self._source = picture_data
 
-        self.width: int = picture_data.shape[1]
-        self.height: int = picture_data.shape[0]
+        else:
+            self._data = to_rgba_array(picture_data)
+            self.height, self.width = self._data.shape[:2]
 
         spam("creating TextureImage with size %d x %d", self.width, self.height)
 
@@ -55,13 +83,74 @@ class TextureImage:
         else:
             self.hotspot = hotspot
 
-        self.data = picture_data
+        # PIL image wrapping self.data, created on first request
+        self._pil_cache: Image.Image = None
+
+    @property
+    def data(self) -> numpy.ndarray:
+        return self.get_data()
 
     def get_pil_image(self) -> Image.Image:
-        return Image.fromarray(self.data)
+        if self._pil_cache is None:
+            self._pil_cache = Image.fromarray(self.get_data())
+
+        return self._pil_cache
 
     def get_data(self) -> numpy.ndarray:
-        return self.data
+        if self._data is None:
+            source = self._source
+            if not isinstance(source, Image.Image):
+                source = source()
+
+            data = to_rgba_array(source)
+            if data.shape[:2] != (self.height, self.width):
+                raise ValueError(f"Texture image data has size {data.shape[1]} x {data.shape[0]}, "
+                                 f"expected {self.width} x {self.height}")
+
+            self._data = data
+            self._source = None
+
+        return self._data
+
+
+def to_rgba_array(picture_data: typing.Union[Image.Image, numpy.ndarray]) -> numpy.ndarray:
+    """
+    Convert image data to a C-contiguous (h, w, 4) uint8 array.
+
+    Raises a ValueError for arrays with another shape, non-integer
+    values or values outside of the uint8 range.
+    """
+    if isinstance(picture_data, Image.Image):
+        if picture_data.mode != 'RGBA':
+            picture_data = picture_data.convert('RGBA')
+
+        # avoid the second copy numpy.array() would make of the exported buffer
+        picture_data = numpy.asarray(picture_data)
+
+    if not isinstance(picture_data, numpy.ndarray):
+        raise ValueError("Texture image must be created from PIL Image "
+                         "or numpy array, not '%s'" % type(picture_data))
+
+    if picture_data.ndim != 3 or picture_data.shape[2] != 4:
+        raise ValueError("Texture image data must have the shape (h, w, 4), "
+                         "not %s" % (picture_data.shape,))
+
+    if picture_data.dtype != numpy.uint8:
+        if not numpy.issubdtype(picture_data.dtype, numpy.integer):
+            raise ValueError("Texture image data must have an integer dtype, "
+                             "not '%s'" % picture_data.dtype)
+
+        if picture_data.size and (picture_data.min() < 0 or picture_data.max() > 255):
+            raise ValueError("Texture image data has values outside of the "
+                             "uint8 range 0..255")
+
+        picture_data = numpy.ascontiguousarray(picture_data, dtype=numpy.uint8)
+
+    elif not picture_data.flags.c_contiguous:
+        # only copy if the data isn't stored contiguously yet
+        picture_data = numpy.ascontiguousarray(picture_data)
+
+    return picture_data
 
 
 class Texture(GenieStructure):
@@ -111,18 +200,15 @@ class Texture(GenieStructure):
                 else:
                     main_palette = palettes[palette_number].array
 
-                for subtex in self._to_subtextures(frame,
-                                                   main_palette,
-                                                   custom_cutter):
-                    self.frames.append(subtex)
+                self.frames.extend(self._to_subtextures(frame,
+                                                        main_palette,
+                                                        custom_cutter))
 
         elif isinstance(input_data, BlendingMode):
+            # the hotspot is in the west corner of a tile.
+            hotspot = (0, TILE_HALFSIZE["y"])
             self.frames = [
-                # the hotspot is in the west corner of a tile.
-                TextureImage(
-                    tile.get_picture_data(),
-                    hotspot=(0, TILE_HALFSIZE["y"])
-                )
+                TextureImage(tile.get_picture_data(), hotspot=hotspot)
                 for tile in input_data.alphamasks
             ]
         else:
@@ -178,3 +264,49 @@ class Texture(GenieStructure):
             (True, "cy", None, "int32_t"),
         )
         return data_format
+
+
+def test_texture_image() -> None:
+    """
+    Tests creating texture images from the supported sources.
+    """
+    import pickle
+
+    from ....testing.testing import assert_value, assert_raises, result
+
+    # PIL images are converted on first access
+    image = TextureImage(Image.new('RGB', (5, 3), (10, 20, 30)), hotspot=(2, 1))
+    assert_value((image.width, image.height), (5, 3))
+    assert_value(image.data.shape, (3, 5, 4))
+    assert_value(image.data[0, 0].tolist(), [10, 20, 30, 255])
+
+    # PIL backed images can be pickled before and after conversion
+    image = TextureImage(Image.new('RGBA', (4, 2), (1, 2, 3, 4)))
+    restored = pickle.loads(pickle.dumps(image))
+    assert_value(restored.data.tolist(), image.data.tolist())
+    assert_value(pickle.loads(pickle.dumps(image)).data.tolist(), image.data.tolist())
+
+    # loader functions require the size and have to match it
+    image = TextureImage(lambda: numpy.zeros((4, 5, 4), dtype=numpy.uint8), size=(5, 4))
+    assert_value(image.data.shape, (4, 5, 4))
+
+    with assert_raises(ValueError):
+        result(TextureImage(lambda: numpy.zeros((4, 5, 4), dtype=numpy.uint8)))
+
+    image = TextureImage(lambda: numpy.zeros((4, 5, 4), dtype=numpy.uint8), size=(99, 99))
+    with assert_raises(ValueError):
+        result(image.get_data())
+
+    # arrays are converted to contiguous uint8 data
+    image = TextureImage(numpy.full((2, 3, 4), 200, dtype=numpy.int64))
+    assert_value(image.data.dtype, numpy.uint8)
+    assert_value(image.data.flags.c_contiguous, True)
+
+    with assert_raises(ValueError):
+        result(TextureImage(numpy.zeros((4, 5, 3), dtype=numpy.uint8)))
+
+    with assert_raises(ValueError):
+        result(TextureImage(numpy.full((2, 2, 4), 300)))
+
+    with assert_raises(ValueError):
+        result(TextureImage(numpy.full((2, 2, 4), 1.7)))
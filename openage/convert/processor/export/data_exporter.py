@@ -33,7 +33,13 @@ class DataExporter:
         for data_file in data_files:
             output_dir = exportdir.joinpath(data_file.targetdir)
             output_content = data_file.dump()
+            extra_files = data_file.dump_extra_files()
 
             # generate human-readable file
             with output_dir[data_file.filename].open('wb') as outfile:
                 outfile.write(output_content.encode('utf-8'))
+
+            # additional files referenced by the human-readable file
+            for extra_filename, extra_content in extra_files.items():
+                with output_dir[extra_filename].open('wb') as outfile:
+                    outfile.write(extra_content)
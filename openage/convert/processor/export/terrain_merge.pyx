@@ -52,7 +52,7 @@ cdef void cmerge_terrain(texture):
     cdef unsigned int flat_frame_width = (frame_width // 2) + 1
     cdef unsigned int flat_frame_height = frame_height
 
-    cdef numpy.uint8_t[:, :, ::1] csubframe_atlas
+    cdef const numpy.uint8_t[:, :, ::1] csubframe_atlas
 
     cdef unsigned int column_idx
     cdef unsigned int row_idx
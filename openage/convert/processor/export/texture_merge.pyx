@@ -80,7 +80,7 @@ cdef void cmerge_frames(texture, cache=None):
     cdef numpy.ndarray[numpy.uint8_t, ndim=3, mode="c"] atlas_data = \
         numpy.zeros((height, width, 4), dtype=numpy.uint8)
     cdef numpy.uint8_t[:, :, ::1] catlas_data = atlas_data
-    cdef numpy.uint8_t[:, :, ::1] csub_frame
+    cdef const numpy.uint8_t[:, :, ::1] csub_frame
 
     cdef int pos_x
     cdef int pos_y
@@ -68,6 +68,10 @@ cdef struct pixel:
 
 ctypedef pixel_t[:, :, :] image_t
 
+# whether debug messages are logged from the pixel comparison loops.
+# set once per search so the loops don't call into logging for every position.
+cdef bint log_debug = False
+
 Point = namedtuple('Point', ['x', 'y'])
 Size = namedtuple('Size', ['width', 'height'])
 FoundResult = namedtuple('FoundResult', ['badness', 'point'])
@@ -183,22 +187,27 @@ cdef float img_subimage_cmp(image_t master, image_t subimage,
     lots of extra pixels, it will just ret when tolerance is met
     """
 
-    logging.debug("Comparing subimage where=%d,%d", where_x, where_y)
+    if log_debug:
+        logging.debug("Comparing subimage where=%d,%d", where_x, where_y)
 
     # Check if subimage even fits in masterimage at POINT
     if ((where_x + subimage.shape[1]) > master.shape[1] or
         (where_y + subimage.shape[0]) > master.shape[0]):
         # Superbad
-        logging.debug("Subimage would not fit here")
+        if log_debug:
+            logging.debug("Subimage would not fit here")
         return 1000
 
     cdef float badness = 0
 
     cdef Py_ssize_t sptx
     cdef Py_ssize_t spty
+    cdef pixel mpx
+    cdef pixel spx
 
-    for sptx in range(subimage.shape[1]):
-        for spty in range(subimage.shape[0]):
+    # iterate row by row to walk the image memory in order
+    for spty in range(subimage.shape[0]):
+        for sptx in range(subimage.shape[1]):
             # Map U/V to X/Y.
             # Grab pels and see if they match
             mpx = img_pixel_get(master, sptx + where_x, spty + where_y)
@@ -207,12 +216,15 @@ cdef float img_subimage_cmp(image_t master, image_t subimage,
             badness += abs(img_pixel_cmp(mpx, spx))
 
             if badness > tolerance:
-                logging.debug("Bail out early, badness > tolerance %d > %d", badness, tolerance)
+                if log_debug:
+                    logging.debug("Bail out early, badness > tolerance %d > %d",
+                                  badness, tolerance)
                 # No match here, bail early
                 return badness
 
     # Matched all of subimage
-    logging.debug("Image match ok, badness = %d", badness)
+    if log_debug:
+        logging.debug("Image match ok, badness = %d", badness)
     return badness
 
 
@@ -301,6 +313,9 @@ cdef visgrep_cli(geom_params, metric_params, img_params):
     Perform search, return list of results.
     """
 
+    global log_debug
+    log_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+
     cdef image_t img, find
     cdef vector[image_t] matches
 
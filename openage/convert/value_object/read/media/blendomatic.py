@@ -43,7 +43,7 @@ class BlendingTile:
         self.width = width
         self.height = height
 
-    def get_picture_data(self) -> numpy.array:
+    def get_picture_data(self) -> numpy.ndarray:
         """
         Return a numpy array of image data for a blending tile.
         """
@@ -71,7 +71,7 @@ class BlendingTile:
 
             tile_rows.append(tile_row_data)
 
-        return numpy.array(tile_rows)
+        return numpy.array(tile_rows, dtype=numpy.uint8)
 
 
 class BlendingMode:
@@ -1458,8 +1458,9 @@ cdef numpy.ndarray determine_rgba_matrix(vector[vector[pixel]] &image_matrix,
     cdef size_t height = image_matrix.size()
     cdef size_t width = image_matrix[0].size()
 
+    # every pixel is written below, so the buffer needs no initialization
     cdef numpy.ndarray[numpy.uint8_t, ndim=3, mode="c"] array_data = \
-        numpy.zeros((height, width, 4), dtype=numpy.uint8)
+        numpy.empty((height, width, 4), dtype=numpy.uint8)
 
     cdef uint8_t[:, ::1] m_lookup = palette
 
@@ -1468,7 +1469,6 @@ cdef numpy.ndarray determine_rgba_matrix(vector[vector[pixel]] &image_matrix,
     cdef uint8_t b
     cdef uint8_t alpha
 
-    cdef vector[pixel] current_row
     cdef pixel px
     cdef pixel_type px_type
     cdef int px_val
@@ -1477,10 +1477,8 @@ cdef numpy.ndarray determine_rgba_matrix(vector[vector[pixel]] &image_matrix,
     cdef size_t y
 
     for y in range(height):
-        current_row = image_matrix[y]
-
         for x in range(width):
-            px = current_row[x]
+            px = image_matrix[y][x]
             px_type = px.type
             px_val = px.value
 
@@ -1538,15 +1536,15 @@ cdef numpy.ndarray determine_rgba_matrix32(vector[vector[pixel32]] &image_matrix
     cdef size_t height = image_matrix.size()
     cdef size_t width = image_matrix[0].size()
 
+    # every pixel is written below, so the buffer needs no initialization
     cdef numpy.ndarray[numpy.uint8_t, ndim=3, mode="c"] array_data = \
-        numpy.zeros((height, width, 4), dtype=numpy.uint8)
+        numpy.empty((height, width, 4), dtype=numpy.uint8)
 
     cdef uint8_t r
     cdef uint8_t g
     cdef uint8_t b
     cdef uint8_t alpha
 
-    cdef vector[pixel32] current_row
     cdef pixel32 px
     cdef pixel_type px_type
     cdef int px_val
@@ -1555,10 +1553,8 @@ cdef numpy.ndarray determine_rgba_matrix32(vector[vector[pixel32]] &image_matrix
     cdef size_t y
 
     for y in range(height):
-        current_row = image_matrix[y]
-
         for x in range(width):
-            px = current_row[x]
+            px = image_matrix[y][x]
             px_type = px.type
 
             if px_type == color_standard:
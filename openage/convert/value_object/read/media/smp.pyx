@@ -701,8 +701,9 @@ cdef numpy.ndarray determine_rgba_matrix(vector[vector[pixel]] &image_matrix,
     cdef size_t height = image_matrix.size()
     cdef size_t width = image_matrix[0].size()
 
+    # every pixel is written below, so the buffer needs no initialization
     cdef numpy.ndarray[numpy.uint8_t, ndim=3, mode="c"] array_data = \
-        numpy.zeros((height, width, 4), dtype=numpy.uint8)
+        numpy.empty((height, width, 4), dtype=numpy.uint8)
 
     cdef uint8_t[:, ::1] m_lookup = palette
 
@@ -713,7 +714,6 @@ cdef numpy.ndarray determine_rgba_matrix(vector[vector[pixel]] &image_matrix,
     cdef uint8_t b
     cdef uint8_t alpha
 
-    cdef vector[pixel] current_row
     cdef pixel px
     cdef pixel_type px_type
     cdef uint8_t px_index
@@ -725,11 +725,8 @@ cdef numpy.ndarray determine_rgba_matrix(vector[vector[pixel]] &image_matrix,
     cdef size_t y
 
     for y in range(height):
-
-        current_row = image_matrix[y]
-
         for x in range(width):
-            px = current_row[x]
+            px = image_matrix[y][x]
             px_type = px.type
             px_index = px.index
             px_palette = px.palette
@@ -803,26 +800,23 @@ cdef numpy.ndarray determine_damage_matrix(vector[vector[pixel]] &image_matrix):
     cdef size_t height = image_matrix.size()
     cdef size_t width = image_matrix[0].size()
 
+    # every pixel is written below, so the buffer needs no initialization
     cdef numpy.ndarray[numpy.uint8_t, ndim=3, mode="c"] array_data = \
-        numpy.zeros((height, width, 4), dtype=numpy.uint8)
+        numpy.empty((height, width, 4), dtype=numpy.uint8)
 
     cdef uint8_t r
     cdef uint8_t g
     cdef uint8_t b
     cdef uint8_t alpha
 
-    cdef vector[pixel] current_row
     cdef pixel px
 
     cdef size_t x
     cdef size_t y
 
     for y in range(height):
-
-        current_row = image_matrix[y]
-
         for x in range(width):
-            px = current_row[x]
+            px = image_matrix[y][x]
 
             r, g, b, alpha = px.damage_modifier_1, px.damage_modifier_2, 0, 255
 
@@ -1014,8 +1014,9 @@ cdef numpy.ndarray determine_rgba_matrix(vector[vector[pixel]] &image_matrix,
     cdef size_t height = image_matrix.size()
     cdef size_t width = image_matrix[0].size()
 
+    # every pixel is written below, so the buffer needs no initialization
     cdef numpy.ndarray[numpy.uint8_t, ndim=3, mode="c"] array_data = \
-        numpy.zeros((height, width, 4), dtype=numpy.uint8)
+        numpy.empty((height, width, 4), dtype=numpy.uint8)
 
     cdef uint8_t[:, ::1] m_lookup = palette
 
@@ -1024,7 +1025,6 @@ cdef numpy.ndarray determine_rgba_matrix(vector[vector[pixel]] &image_matrix,
     cdef uint8_t b = 0
     cdef uint8_t alpha = 0
 
-    cdef vector[pixel] current_row
     cdef pixel px
     cdef pixel_type px_type
     cdef uint8_t px_index = 0
@@ -1036,11 +1036,8 @@ cdef numpy.ndarray determine_rgba_matrix(vector[vector[pixel]] &image_matrix,
     cdef size_t y = 0
 
     for y in range(height):
-
-        current_row = image_matrix[y]
-
         for x in range(width):
-            px = current_row[x]
+            px = image_matrix[y][x]
 
             px_type = px.type
             px_index = px.index
@@ -1108,26 +1105,23 @@ cdef numpy.ndarray determine_damage_matrix(vector[vector[pixel]] &image_matrix):
     cdef size_t height = image_matrix.size()
     cdef size_t width = image_matrix[0].size()
 
+    # every pixel is written below, so the buffer needs no initialization
     cdef numpy.ndarray[numpy.uint8_t, ndim=3, mode="c"] array_data = \
-        numpy.zeros((height, width, 4), dtype=numpy.uint8)
+        numpy.empty((height, width, 4), dtype=numpy.uint8)
 
     cdef uint8_t r = 0
     cdef uint8_t g = 0
     cdef uint8_t b = 0
     cdef uint8_t alpha = 0
 
-    cdef vector[pixel] current_row
     cdef pixel px
 
     cdef size_t x = 0
     cdef size_t y = 0
 
     for y in range(height):
-
-        current_row = image_matrix[y]
-
         for x in range(width):
-            px = current_row[x]
+            px = image_matrix[y][x]
 
             r, g, b, alpha = px.damage_modifier_1, px.damage_modifier_2, 0, 255
 
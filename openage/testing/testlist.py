@@ -27,6 +27,10 @@ def tests_py():
     yield ("openage.cabextract.test.test", "test CAB archive extraction",
            lambda env: env["has_assets"])
     yield "openage.convert.service.init.changelog.test"
+    yield ("openage.convert.entity_object.export.formats.terrain_metadata.test_frames_file",
+           "test the binary frames file of terrain definitions")
+    yield ("openage.convert.entity_object.export.texture.test_texture_image",
+           "test creating texture images")
     yield "openage.cppinterface.exctranslate_tests.cpp_to_py"
     yield ("openage.cppinterface.exctranslate_tests.cpp_to_py_bounce",
            "translates the exception back and forth a few times")